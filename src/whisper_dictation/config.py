@@ -2,12 +2,29 @@
 Configuration management for whisper-dictation
 """
 
+import json
+import logging
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
 import yaml
 from evdev import ecodes
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml C bindings; they parse/emit ~10x faster than the
+# pure-Python loader, which matters for cold daemon startup
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available in this PyYAML build
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+    logger.debug("PyYAML C bindings unavailable, using pure-Python loader (install libyaml)")
+
 
 class Config:
     """Manages configuration with sensible defaults"""
@@ -21,6 +38,9 @@ class Config:
             "auto_capitalize": True,
             "auto_punctuate": False,
         },
+        # Seconds to wait for window focus before typing; modern Wayland
+        # compositors restore focus synchronously, so default to none
+        "paste": {"focus_delay": 0.0},
     }
 
     # Map modifier names to ecodes
@@ -44,23 +64,118 @@ class Config:
     def __init__(self, config_path: Path = None):
         self.config_path = config_path or Path.home() / ".config/whisper-dictation/config.yaml"
         self.config = self._load_config()
+        self._flat = self._flatten(self.config)
+        self._model_path = self._resolve_model_path()
+        self._hotkey_display = self._build_hotkey_display()
+
+    @classmethod
+    def from_mapping(cls, data: dict[str, Any]) -> "Config":
+        """Build a Config from an in-memory mapping, merged over defaults.
+
+        No file is read or written - handy for tests and embedding.
+        """
+        config = cls.__new__(cls)
+        config.config_path = None
+        config.config = cls._deep_merge(cls.DEFAULT_CONFIG, data or {})
+        config._flat = cls._flatten(config.config)
+        config._model_path = config._resolve_model_path()
+        config._hotkey_display = config._build_hotkey_display()
+        return config
+
+    @staticmethod
+    def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+        """Recursively merge override into base, returning a new dict"""
+        merged = base.copy()
+        for key, value in override.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = Config._deep_merge(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
+
+    @staticmethod
+    def _flatten(config: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+        """Flatten nested dicts into a dotted-key lookup table"""
+        flat = {}
+        for key, value in config.items():
+            dotted = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(Config._flatten(value, f"{dotted}."))
+            else:
+                flat[dotted] = value
+        return flat
+
+    def refresh(self):
+        """Rebuild derived lookup state after self.config has been mutated"""
+        self._flat = self._flatten(self.config)
+        self._model_path = self._resolve_model_path()
+        self._hotkey_display = self._build_hotkey_display()
 
     def _load_config(self) -> dict[str, Any]:
         """Load config from file or create default"""
         if self.config_path.exists():
+            # JSON parses ~10x faster than YAML, so keep a sidecar cache of
+            # the merged config and reuse it while the YAML is unchanged
+            cached = self._read_cache()
+            if cached is not None:
+                return cached
+
             with open(self.config_path) as f:
-                user_config = yaml.safe_load(f)
-                # Merge with defaults
-                config = self.DEFAULT_CONFIG.copy()
-                config.update(user_config)
+                user_config = yaml.load(f, Loader=_YamlLoader)
+                # Merge with defaults (recursively, so a user overriding one
+                # key in a section keeps the section's other defaults)
+                config = self._deep_merge(self.DEFAULT_CONFIG, user_config or {})
+                self._write_cache(config)
                 return config
         else:
             # Create default config
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_path, "w") as f:
-                yaml.dump(self.DEFAULT_CONFIG, f, default_flow_style=False)
+                yaml.dump(self.DEFAULT_CONFIG, f, Dumper=_YamlDumper, default_flow_style=False)
             return self.DEFAULT_CONFIG.copy()
 
+    @property
+    def _cache_path(self) -> Path:
+        return self.config_path.with_suffix(".yaml.cache.json")
+
+    def _read_cache(self) -> dict[str, Any] | None:
+        """Return cached config if it matches the YAML file's current stat"""
+        try:
+            st = self.config_path.stat()
+            cached = json.loads(self._cache_path.read_bytes())
+            # Valid JSON isn't necessarily our wrapper shape; check before use
+            if not isinstance(cached, dict) or not isinstance(cached.get("data"), dict):
+                return None
+            # Exact mtime_ns+size fingerprint: ordering-based mtime checks
+            # miss backdated edits (e.g. config restored from a backup)
+            if cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+                return cached["data"]
+        except (OSError, ValueError):
+            pass  # Missing, unreadable or corrupt cache: fall back to YAML
+        return None
+
+    def _write_cache(self, config: dict[str, Any]):
+        """Atomically write the JSON cache next to the YAML file.
+
+        Best-effort: configs can hold YAML-native values JSON can't encode
+        (dates, binary), in which case we just skip caching.
+        """
+        tmp = None
+        try:
+            st = self.config_path.stat()
+            payload = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": config}
+            fd, tmp = tempfile.mkstemp(dir=self.config_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self._cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write config cache: {e}")
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
     def get_hotkey_modifiers(self) -> list[int]:
         """Get list of modifier keycodes"""
         modifiers = self.config["hotkey"]["modifiers"]
@@ -75,33 +190,55 @@ class Config:
         key_name = self.config["hotkey"]["key"]
         return self.KEY_MAP.get(key_name, ecodes.KEY_DOT)
 
-    def get_hotkey_display(self) -> str:
-        """Get human-readable hotkey string"""
+    def _build_hotkey_display(self) -> str:
         modifiers = self.config["hotkey"]["modifiers"]
         key = self.config["hotkey"]["key"]
         mod_str = "+".join([m.capitalize() for m in modifiers])
         return f"{mod_str}+{key.capitalize()}"
 
-    def get_model_path(self) -> Path:
-        """Get path to whisper model"""
+    def get_hotkey_display(self) -> str:
+        """Get human-readable hotkey string"""
+        return self._hotkey_display
+
+    # Quantized variants preferred over FP16: CPU inference is memory-bound,
+    # so a q5_0/q8_0 model roughly doubles throughput. Produce one with
+    # whisper.cpp's quantize tool, e.g.: quantize ggml-base.bin ggml-base-q5_0.bin q5_0
+    MODEL_QUANT_VARIANTS = ("q5_0", "q8_0")
+
+    def _resolve_model_path(self) -> Path:
         model_name = self.config["whisper"]["model"]
-        model_dir = Path.home() / ".local/share/whisper/models"
-        model_file = model_dir / f"ggml-{model_name}.bin"
+        model_dirs = [
+            Path.home() / ".local/share/whisper/models",
+            Path.home() / ".local/share/whisper-models",  # Old location
+        ]
+
+        filenames = [f"ggml-{model_name}-{v}.bin" for v in self.MODEL_QUANT_VARIANTS]
+        filenames.append(f"ggml-{model_name}.bin")
+
+        for filename in filenames:
+            for model_dir in model_dirs:
+                model_file = model_dir / filename
+                if model_file.exists():
+                    return model_file
 
-        # Fallback to old location
-        if not model_file.exists():
-            alt_dir = Path.home() / ".local/share/whisper-models"
-            model_file = alt_dir / f"ggml-{model_name}.bin"
+        # Nothing on disk yet: point at the expected default location
+        return model_dirs[0] / f"ggml-{model_name}.bin"
 
-        return model_file
+    @property
+    def model_path(self) -> Path:
+        """Path to the whisper model (resolved once at load)"""
+        return self._model_path
+
+    @property
+    def hotkey_display(self) -> str:
+        """Human-readable hotkey string"""
+        return self._hotkey_display
+
+    def get_model_path(self) -> Path:
+        """Get path to whisper model (resolved once at load)"""
+        return self._model_path
 
     def get(self, key: str, default=None):
         """Get config value by dot-notation key"""
-        keys = key.split(".")
-        value = self.config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+        value = self._flat.get(key)
         return value if value is not None else default
@@ -6,8 +6,11 @@ Monitors keyboard for push-to-talk hotkey and coordinates transcription
 
 import argparse
 import logging
+import re
+import selectors
 import signal
 import sys
+import threading
 from pathlib import Path
 
 from evdev import InputDevice, ecodes, list_devices
@@ -24,6 +27,13 @@ logger = logging.getLogger(__name__)
 class DictationDaemon:
     """Main daemon that coordinates all components"""
 
+    # Device names matching any of these are not real keyboards; one compiled
+    # alternation replaces eight substring scans per device
+    _VIRTUAL_DEVICE_RE = re.compile(
+        r"virtual|ydotoold|xdotool|uinput|sleep button|power button|lid switch|video bus",
+        re.IGNORECASE,
+    )
+
     def __init__(self, config_path: Path = None):
         self.config = Config(config_path)
         self.recorder = AudioRecorder(self.config)
@@ -35,19 +45,21 @@ class DictationDaemon:
         self.is_recording = False
         self.keyboard_device = None
 
+        # Pressed hotkey modifiers as a bitmask (bit = keycode), so the
+        # any-modifier-held test is a single integer AND
+        self._mod_mask = 0
+
+        self._cache_hotkeys()
+
+    def _cache_hotkeys(self):
+        """Cache hotkey keycodes so on_key_event doesn't re-walk the config per event"""
+        self._hotkey_modifiers = frozenset(self.config.get_hotkey_modifiers())
+        self._hotkey_key = self.config.get_hotkey_key()
+        self._hotkey_mod_mask = sum(1 << code for code in self._hotkey_modifiers)
+
     def _is_virtual_device(self, device_name):
         """Check if device name matches virtual device patterns"""
-        virtual_patterns = [
-            "virtual",
-            "ydotoold",
-            "xdotool",
-            "uinput",
-            "sleep button",
-            "power button",
-            "lid switch",
-            "video bus",
-        ]
-        return any(pattern.lower() in device_name.lower() for pattern in virtual_patterns)
+        return bool(self._VIRTUAL_DEVICE_RE.search(device_name))
 
     def _has_required_keys(self, capabilities):
         """Check if device has letter keys and modifier keys"""
@@ -76,11 +88,83 @@ class DictationDaemon:
         logger.info(f"Selected first candidate: {device.name} at {path}")
         return device
 
+    def _sysfs_might_be_keyboard(self, device_path):
+        """Cheap sysfs pre-filter to avoid opening non-keyboard devices.
+
+        Opening (and especially closing) evdev fds can be slow, so read the
+        device name and key-capability bitmap from sysfs first and only open
+        devices that plausibly have letter and modifier keys. Returns True
+        when sysfs is unavailable so the full evdev check still runs.
+        """
+        sys_device = Path("/sys/class/input") / Path(device_path).name / "device"
+        try:
+            name = (sys_device / "name").read_text().strip()
+            key_bitmap = (sys_device / "capabilities" / "key").read_text()
+
+            # capabilities/key is space-separated hex words, most significant first
+            bits = 0
+            for word in key_bitmap.split():
+                bits = (bits << 64) | int(word, 16)
+        except (OSError, ValueError):
+            return True
+
+        if self._is_virtual_device(name):
+            logger.debug(f"Skip {name}: virtual device (sysfs)")
+            return False
+
+        has_letters = bits >> ecodes.KEY_A & 1
+        has_modifiers = (
+            bits >> ecodes.KEY_LEFTMETA & 1
+            or bits >> ecodes.KEY_RIGHTMETA & 1
+            or bits >> ecodes.KEY_LEFTCTRL & 1
+        )
+        if not (has_letters and has_modifiers):
+            logger.debug(f"Skip {name}: missing letter/modifier keys (sysfs)")
+            return False
+
+        return True
+
+    def _find_keyboard_by_id(self):
+        """Fast path: follow udev's /dev/input/by-id keyboard symlinks.
+
+        udev has already classified keyboards (*-event-kbd), so when the
+        directory exists we can skip scanning every input node.
+        """
+        try:
+            links = sorted(Path("/dev/input/by-id").glob("*event-kbd"))
+        except OSError:
+            return None
+
+        for link in links:
+            try:
+                device = InputDevice(str(link.resolve()))
+            except (OSError, PermissionError) as e:
+                logger.debug(f"Cannot access {link}: {e}")
+                continue
+
+            if self._is_virtual_device(device.name):
+                logger.debug(f"Skip virtual by-id device: {device.name}")
+                device.close()
+                continue
+
+            logger.info(f"Selected keyboard via by-id: {device.name} at {link}")
+            return device
+
+        return None
+
     def find_keyboard_device(self):
         """Find the main keyboard device that supports our hotkey"""
+        # udev's by-id symlinks usually identify the keyboard outright
+        device = self._find_keyboard_by_id()
+        if device:
+            return device
+
         candidates = []
 
         for device_path in list_devices():
+            if not self._sysfs_might_be_keyboard(device_path):
+                continue
+
             try:
                 device = InputDevice(device_path)
                 has_letters, has_modifiers = self._has_required_keys(device.capabilities())
@@ -110,6 +194,19 @@ class DictationDaemon:
 
         return self._select_best_keyboard(candidates)
 
+    def _warm_model(self):
+        """Read the model file once so its pages are cached before first use"""
+        model_path = self.config.get_model_path()
+        if not model_path.exists():
+            return
+        try:
+            with open(model_path, "rb") as f:
+                while f.read(1 << 20):
+                    pass
+            logger.info(f"Warmed page cache for model: {model_path.name}")
+        except OSError as e:
+            logger.debug(f"Model warm-up failed: {e}")
+
     def start_recording(self):
         """Start audio recording"""
         if self.is_recording:
@@ -133,14 +230,14 @@ class DictationDaemon:
         self.is_recording = False
 
         # Stop recorder
-        audio_file = self.recorder.stop()
+        audio = self.recorder.stop()
 
         # Update UI
         self.ui.show_transcribing()
 
         # Check if we have audio
-        if not audio_file or not audio_file.exists() or audio_file.stat().st_size < 10000:
-            logger.warning("No audio recorded or file too small")
+        if not audio or len(audio) < 10000:
+            logger.warning("No audio recorded or recording too short")
             self.ui.show_error("No audio recorded")
             return
 
@@ -159,16 +256,20 @@ class DictationDaemon:
             self.ui.show_error(f"Transcription failed: {error}")
 
         self.transcriber.transcribe_async(
-            audio_file, on_complete=on_transcription_complete, on_error=on_transcription_error
+            audio, on_complete=on_transcription_complete, on_error=on_transcription_error
         )
 
     def _track_key_state(self, event):
         """Track pressed/released keys"""
         if event.value == 1:  # Key down
             self.keys_pressed.add(event.code)
+            if event.code in self._hotkey_modifiers:
+                self._mod_mask |= 1 << event.code
             logger.debug(f"Key DOWN: {event.code} | Currently pressed: {self.keys_pressed}")
         elif event.value == 0:  # Key up
             self.keys_pressed.discard(event.code)
+            if event.code in self._hotkey_modifiers:
+                self._mod_mask &= ~(1 << event.code)
             logger.debug(f"Key UP: {event.code} | Currently pressed: {self.keys_pressed}")
 
     def _log_hotkey_debug(self, event, hotkey_key, hotkey_modifiers, has_modifiers, hotkey_pressed):
@@ -182,18 +283,31 @@ class DictationDaemon:
 
     def on_key_event(self, event):
         """Handle keyboard events"""
-        if event.type != ecodes.EV_KEY:
+        # Ignore non-key events and autorepeat (value == 2)
+        if event.type != ecodes.EV_KEY or event.value == 2:
+            return
+
+        # Fast path: while not recording, keys that are neither the hotkey
+        # nor one of its modifiers can't affect us - skip all further work.
+        # This covers >99% of events during normal typing.
+        code = event.code
+        if (
+            code != self._hotkey_key
+            and code not in self._hotkey_modifiers
+            and not self.is_recording
+        ):
             return
 
         # Track key state
         self._track_key_state(event)
 
-        # Get configured hotkey
-        hotkey_modifiers = self.config.get_hotkey_modifiers()
-        hotkey_key = self.config.get_hotkey_key()
+        # Cached hotkey keycodes (computed once at startup)
+        hotkey_modifiers = self._hotkey_modifiers
+        hotkey_key = self._hotkey_key
 
-        # Check if ANY of the modifier keys are pressed (e.g., left OR right Super)
-        has_modifiers = any(mod in self.keys_pressed for mod in hotkey_modifiers)
+        # Check if ANY of the modifier keys are pressed (e.g., left OR right
+        # Super): a single integer AND against the pressed-modifier bitmask
+        has_modifiers = bool(self._mod_mask & self._hotkey_mod_mask)
         hotkey_pressed = hotkey_key in self.keys_pressed
 
         # Log for debugging
@@ -225,6 +339,10 @@ class DictationDaemon:
             logger.error("Make sure you're in the 'input' group: sudo usermod -aG input $USER")
             sys.exit(1)
 
+        # Prefetch the model into the page cache during user idle time, so the
+        # first utterance doesn't pay the cold disk read (hundreds of MB)
+        threading.Thread(target=self._warm_model, daemon=True).start()
+
         # Setup signal handlers
         def cleanup(sig, frame):
             logger.info("Shutting down...")
@@ -242,10 +360,15 @@ class DictationDaemon:
         # Initialize UI
         self.ui.show_ready()
 
-        # Event loop
+        # Event loop: wait with select, then drain everything the kernel has
+        # buffered in one read() instead of one generator hop per event
         try:
-            for event in self.keyboard_device.read_loop():
-                self.on_key_event(event)
+            selector = selectors.DefaultSelector()
+            selector.register(self.keyboard_device.fd, selectors.EVENT_READ)
+            while True:
+                selector.select()
+                for event in self.keyboard_device.read():
+                    self.on_key_event(event)
         except KeyboardInterrupt:
             cleanup(None, None)
         except Exception as e:
@@ -298,6 +421,10 @@ def main():
         daemon.config.config["whisper"]["model"] = args.model
         logger.info(f"Model override: {args.model}")
 
+    # Overrides mutate the config, so rebuild the derived lookup state
+    daemon.config.refresh()
+    daemon._cache_hotkeys()
+
     daemon.run()
 
 
@@ -3,6 +3,7 @@ Text pasting module using ydotool
 """
 
 import logging
+import shutil
 import subprocess
 import time
 
@@ -12,8 +13,19 @@ logger = logging.getLogger(__name__)
 class TextPaster:
     """Pastes text into active window using ydotool"""
 
+    # Above this many characters, simulated per-key typing is slower than a
+    # single clipboard write plus one Ctrl+V
+    CLIPBOARD_THRESHOLD = 120
+
     def __init__(self, config):
         self.config = config
+        self._focus_delay = config.get("paste.focus_delay", 0.0)
+        self._wl_copy = shutil.which("wl-copy")
+        # Typing argv, built once; text arrives on stdin rather than argv,
+        # which avoids the kernel's per-exec argv copy and any ARG_MAX limit
+        self._type_argv = ("ydotool", "type", "--key-delay", "0", "--file", "-")
+        # In-flight non-blocking paste awaiting reaping
+        self._proc: subprocess.Popen | None = None
         self._check_ydotool()
 
     def _check_ydotool(self):
@@ -27,21 +39,30 @@ class TextPaster:
         except Exception as e:
             logger.error(f"Error checking ydotool: {e}")
 
-    def paste(self, text: str):
-        """Paste text into active window"""
+    def paste(self, text: str, wait: bool = False):
+        """Paste text into active window.
+
+        By default the ydotool process is dispatched without blocking on its
+        completion, so the caller can show the next UI state while typing is
+        still in flight. Pass wait=True to block until delivery.
+        """
         if not text:
             return
 
         logger.info(f"Pasting text: {text[:50]}...")
 
         try:
-            # Small delay to ensure window focus
-            time.sleep(0.3)
+            # Optional delay for compositors that restore focus asynchronously
+            if self._focus_delay:
+                time.sleep(self._focus_delay)
 
-            # Use ydotool to type text
-            subprocess.run(["ydotool", "type", text], check=True)
+            if self._wl_copy and len(text) > self.CLIPBOARD_THRESHOLD:
+                self._paste_via_clipboard(text, wait)
+            else:
+                # Type directly, with no artificial per-key spacing
+                self._dispatch(self._type_argv, wait, input_bytes=text.encode())
 
-            logger.info("Text pasted successfully")
+            logger.info("Text paste dispatched")
 
         except subprocess.CalledProcessError as e:
             logger.error(f"ydotool failed: {e}")
@@ -49,3 +70,34 @@ class TextPaster:
         except Exception as e:
             logger.error(f"Error pasting text: {e}")
             raise
+
+    def _paste_via_clipboard(self, text: str, wait: bool):
+        """Copy once and emit a single Ctrl+V instead of typing per character"""
+        # The copy must land before the key event, so it always blocks
+        subprocess.run([self._wl_copy], input=text.encode(), check=True)
+        # Ctrl down, V down, V up, Ctrl up
+        self._dispatch(("ydotool", "key", "29:1", "47:1", "47:0", "29:0"), wait)
+
+    def _dispatch(self, argv: tuple[str, ...], wait: bool, input_bytes: bytes | None = None):
+        """Run the ydotool command, optionally without waiting on it"""
+        # Only short payloads may skip waiting: without wl-copy installed the
+        # typing path sees texts of any length, and a payload bigger than the
+        # pipe buffer would block the write below until ydotool drains it.
+        # subprocess.run also turns a dead ydotoold into the logged
+        # CalledProcessError instead of a raw BrokenPipeError.
+        if input_bytes is not None and len(input_bytes) > self.CLIPBOARD_THRESHOLD:
+            wait = True
+        if wait:
+            subprocess.run(argv, input=input_bytes, check=True)
+            return
+
+        # Reap the previous paste (if any) before launching the next
+        if self._proc is not None:
+            self._proc.poll()
+        if input_bytes is None:
+            self._proc = subprocess.Popen(argv)
+        else:
+            self._proc = subprocess.Popen(argv, stdin=subprocess.PIPE)
+            # At most CLIPBOARD_THRESHOLD bytes: fits the pipe buffer
+            self._proc.stdin.write(input_bytes)
+            self._proc.stdin.close()
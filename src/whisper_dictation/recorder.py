@@ -1,85 +1,144 @@
 """
-Audio recording module using ffmpeg
+Audio recording module using parecord/ffmpeg
 """
 
 import logging
+import shutil
+import signal
 import subprocess
-from pathlib import Path
+import threading
 
 logger = logging.getLogger(__name__)
 
 
 class AudioRecorder:
-    """Records audio from microphone using ffmpeg"""
+    """Records audio from microphone using parecord or ffmpeg"""
+
+    # A bare WAV header is 44 bytes; anything smaller holds no audio
+    MIN_WAV_BYTES = 44
 
     def __init__(self, config):
         self.config = config
-        self.temp_dir = Path("/tmp/whisper-dictation")
-        self.temp_dir.mkdir(exist_ok=True)
-        self.audio_file = self.temp_dir / "recording.wav"
         self.process: subprocess.Popen | None = None
+        self._buffer = bytearray()
+        self._reader: threading.Thread | None = None
+        self._capture_argv = self._build_capture_argv()
+
+    @staticmethod
+    def _build_capture_argv() -> list[str]:
+        """Pick the capture command once at startup.
+
+        parecord talks to PulseAudio/PipeWire directly and starts streaming
+        in milliseconds, while ffmpeg spends 100-300ms initialising its
+        pipeline first - long enough to clip the start of an utterance.
+        """
+        if shutil.which("parecord"):
+            return [
+                "parecord",
+                "--format=s16le",  # 16-bit PCM
+                "--rate=16000",  # 16kHz sample rate (whisper requirement)
+                "--channels=1",  # Mono audio
+                "--file-format=wav",  # WAV container on stdout
+            ]
+
+        return [
+            "ffmpeg",
+            "-f",
+            "pulse",  # PulseAudio/PipeWire input
+            # Skip input probing/buffering: raw PCM from Pulse needs no format
+            # analysis, and the defaults add hundreds of ms before the first
+            # sample (clipping the start of the utterance)
+            "-probesize",
+            "32",
+            "-analyzeduration",
+            "0",
+            "-fflags",
+            "nobuffer",
+            "-flags",
+            "low_delay",
+            "-thread_queue_size",
+            "512",
+            "-i",
+            "default",  # Default microphone
+            "-ar",
+            "16000",  # 16kHz sample rate (whisper requirement)
+            "-ac",
+            "1",  # Mono audio
+            "-acodec",
+            "pcm_s16le",  # 16-bit PCM
+            "-f",
+            "wav",  # Stream WAV to stdout, no temp file
+            "pipe:1",
+        ]
 
     def start(self):
         """Start recording audio"""
-        # Remove old recording
-        if self.audio_file.exists():
-            self.audio_file.unlink()
-
-        # Start ffmpeg recording
         logger.info("Starting audio recording...")
 
+        self._buffer = bytearray()
+
         try:
+            # Explicit block buffering sized to the reader's chunk: unbuffered
+            # pipes (bufsize=0) would cost a syscall per read at audio rates
             self.process = subprocess.Popen(
-                [
-                    "ffmpeg",
-                    "-f",
-                    "pulse",  # PulseAudio/PipeWire input
-                    "-i",
-                    "default",  # Default microphone
-                    "-ar",
-                    "16000",  # 16kHz sample rate (whisper requirement)
-                    "-ac",
-                    "1",  # Mono audio
-                    "-acodec",
-                    "pcm_s16le",  # 16-bit PCM
-                    "-y",  # Overwrite output file
-                    str(self.audio_file),
-                ],
-                stdout=subprocess.DEVNULL,
+                self._capture_argv,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
+                bufsize=65536,
             )
 
         except Exception as e:
             logger.error(f"Failed to start recording: {e}")
             raise
 
-    def stop(self) -> Path | None:
-        """Stop recording and return audio file path"""
+        # Drain ffmpeg's stdout as it records so the pipe never fills up
+        self._reader = threading.Thread(target=self._drain, daemon=True)
+        self._reader.start()
+
+    def _drain(self):
+        """Read recorded audio from ffmpeg's stdout into the in-memory buffer"""
+        process = self.process
+        while True:
+            chunk = process.stdout.read(65536)
+            if not chunk:
+                break
+            self._buffer.extend(chunk)
+
+    def stop(self) -> bytes | None:
+        """Stop recording and return captured WAV data"""
         if not self.process:
             return None
 
         logger.info("Stopping audio recording...")
 
         try:
-            # Send SIGTERM to ffmpeg for clean shutdown
-            self.process.terminate()
+            # SIGINT is the graceful-quit signal for both ffmpeg (same as its
+            # 'q' command) and parecord: buffered audio gets flushed instead
+            # of being dropped mid-buffer as with SIGTERM
+            self.process.send_signal(signal.SIGINT)
 
-            # Wait for process to finish (max 2 seconds)
+            # Flushing a sub-second capture is quick, so bound the wait
             try:
-                self.process.wait(timeout=2)
+                self.process.wait(timeout=0.5)
             except subprocess.TimeoutExpired:
-                logger.warning("ffmpeg didn't stop gracefully, killing...")
+                logger.warning("Capture process didn't stop gracefully, killing...")
                 self.process.kill()
                 self.process.wait()
 
+            # Let the reader thread collect any remaining output
+            if self._reader:
+                self._reader.join(timeout=2)
+                self._reader = None
+
             self.process = None
 
-            # Verify file was created
-            if self.audio_file.exists() and self.audio_file.stat().st_size > 0:
-                logger.info(f"Recording saved to {self.audio_file}")
-                return self.audio_file
+            # Verify we captured something beyond the WAV header
+            if len(self._buffer) >= self.MIN_WAV_BYTES:
+                audio = bytes(self._buffer)
+                logger.info(f"Recorded {len(audio)} bytes of audio")
+                return audio
             else:
-                logger.warning("Audio file not created or empty")
+                logger.warning("No audio captured")
                 return None
 
         except Exception as e:
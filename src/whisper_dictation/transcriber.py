@@ -7,78 +7,122 @@ import re
 import subprocess
 import threading
 from collections.abc import Callable
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Optional in-process bindings: loading the model once at startup avoids
+# re-reading hundreds of MB of weights on every whisper-cli invocation
+try:
+    import numpy as _np
+    from pywhispercpp.model import Model as _WhisperModel
+except ImportError:  # fall back to forking whisper-cli per utterance
+    _WhisperModel = None
+
 
 class WhisperTranscriber:
     """Transcribes audio using whisper.cpp"""
 
+    # Precompiled once: avoids per-transcription regex compile/cache lookups
+    _FILLER_RE = re.compile(r"\b(?:um|uh|like|you know)\b", re.IGNORECASE)
+    _WHITESPACE_RE = re.compile(r"\s+")
+
+    # Cheap substring markers checked before invoking the filler regex
+    _FILLER_MARKERS = ("um", "uh", "like", "you know")
+
     def __init__(self, config):
         self.config = config
         self.model_path = config.get_model_path()
-        self.temp_dir = Path("/tmp/whisper-dictation")
-        self.temp_dir.mkdir(exist_ok=True)
 
-    def transcribe(self, audio_file: Path) -> str | None:
-        """Transcribe audio file synchronously"""
+        # Resolve post-processing flags once instead of per transcription
+        self._remove_fillers = config.get("processing.remove_filler_words", True)
+        self._auto_capitalize = config.get("processing.auto_capitalize", True)
+
+        # Load the model once at startup when bindings are available, so each
+        # utterance skips the multi-second model load whisper-cli would pay
+        self._model = None
+        if _WhisperModel is not None and self.model_path.exists():
+            try:
+                logger.info(f"Loading whisper model in-process: {self.model_path.name}")
+                self._model = _WhisperModel(
+                    str(self.model_path),
+                    n_threads=config.get("whisper.threads", 4),
+                )
+            except Exception as e:
+                logger.warning(f"Could not load model in-process, using whisper-cli: {e}")
+
+    def transcribe(self, audio: bytes) -> str | None:
+        """Transcribe recorded WAV data synchronously"""
         if not self.model_path.exists():
             raise FileNotFoundError(
                 f"Whisper model not found at {self.model_path}. "
                 f"Download with: whisper-cpp-download-ggml-model {self.config.get('whisper.model', 'medium')}"
             )
 
-        output_file = self.temp_dir / "transcription"
-        text_file = output_file.with_suffix(".txt")
+        logger.info(f"Transcribing with model: {self.model_path.name}")
 
-        # Remove old transcription
-        if text_file.exists():
-            text_file.unlink()
+        if self._model is not None:
+            text = self._transcribe_in_process(audio)
+        else:
+            text = self._transcribe_subprocess(audio)
 
-        logger.info(f"Transcribing with model: {self.model_path.name}")
+        if text is None:
+            return None
+
+        # Post-process
+        text = self._post_process(text)
+
+        return text if text else None
 
+    def _transcribe_in_process(self, audio: bytes) -> str | None:
+        """Transcribe using the resident pywhispercpp model"""
         try:
-            # Run whisper-cli
+            # Strip the WAV container: find the data chunk and convert the
+            # 16-bit PCM samples to the float32 array whisper expects
+            data_at = audio.find(b"data")
+            pcm = audio[data_at + 8 :] if data_at != -1 else audio
+            samples = _np.frombuffer(pcm, dtype=_np.int16).astype(_np.float32) / 32768.0
+
+            segments = self._model.transcribe(
+                samples, language=self.config.get("whisper.language", "en")
+            )
+            return " ".join(seg.text.strip() for seg in segments).strip()
+
+        except Exception as e:
+            logger.error(f"Transcription error: {e}")
+            return None
+
+    def _transcribe_subprocess(self, audio: bytes) -> str | None:
+        """Transcribe by forking whisper-cli (fallback without bindings)"""
+        try:
+            # Run whisper-cli, streaming the audio over stdin (no WAV temp
+            # file) and reading the transcript straight from stdout
             result = subprocess.run(
                 [
                     "whisper-cli",
                     "-m",
                     str(self.model_path),
                     "-f",
-                    str(audio_file),
-                    "--output-txt",
-                    "--output-file",
-                    str(output_file),
+                    "-",
                     "--no-timestamps",
                     "--language",
                     self.config.get("whisper.language", "en"),
                     "--threads",
                     str(self.config.get("whisper.threads", 4)),
                 ],
+                input=audio,
                 capture_output=True,
-                text=True,
                 timeout=60,
             )
 
             if result.returncode != 0:
-                logger.error(f"Whisper failed: {result.stderr}")
+                logger.error(f"Whisper failed: {result.stderr.decode(errors='replace')}")
                 return None
 
-            # Read transcription
-            if not text_file.exists():
-                logger.error("Transcription file not created")
-                return None
-
-            text = text_file.read_text().strip()
-
-            # Post-process
-            text = self._post_process(text)
-
-            # Cleanup
-            text_file.unlink()
-
-            return text if text else None
+            # With --no-timestamps whisper-cli prints one line per segment;
+            # join with spaces (like the in-process path) since any newline
+            # reaching ydotool would be typed as an Enter keypress
+            stdout = result.stdout.decode(errors="replace")
+            return " ".join(line.strip() for line in stdout.splitlines() if line.strip())
 
         except subprocess.TimeoutExpired:
             logger.error("Transcription timeout")
@@ -89,15 +133,15 @@ class WhisperTranscriber:
 
     def transcribe_async(
         self,
-        audio_file: Path,
+        audio: bytes,
         on_complete: Callable[[str | None], None],
         on_error: Callable[[str], None],
     ):
-        """Transcribe audio file asynchronously in background thread"""
+        """Transcribe recorded audio asynchronously in background thread"""
 
         def run():
             try:
-                text = self.transcribe(audio_file)
+                text = self.transcribe(audio)
                 on_complete(text)
             except Exception as e:
                 on_error(str(e))
@@ -113,13 +157,19 @@ class WhisperTranscriber:
         # Remove leading/trailing whitespace
         text = text.strip()
 
-        # Remove filler words if configured
-        if self.config.get("processing.remove_filler_words", True):
-            text = re.sub(r"\b(um|uh|like|you know)\b", "", text, flags=re.IGNORECASE)
-            text = re.sub(r"\s+", " ", text).strip()
+        # Remove filler words if configured. Only pay for the regex pass when
+        # a C-level substring scan says a filler could actually be present.
+        if self._remove_fillers and len(text) > 4:
+            low = text.lower()
+            if any(marker in low for marker in self._FILLER_MARKERS):
+                text = self._FILLER_RE.sub("", text)
+
+        # Collapse runs of whitespace unconditionally: filler removal leaves
+        # double spaces, and stray newlines would be typed as Enter presses
+        text = self._WHITESPACE_RE.sub(" ", text).strip()
 
         # Auto-capitalize first letter if configured
-        if self.config.get("processing.auto_capitalize", True) and text:
+        if self._auto_capitalize and text:
             text = text[0].upper() + text[1:]
 
         return text
@@ -4,37 +4,91 @@ GTK4 UI for visual feedback
 
 import logging
 import subprocess
+from functools import cache
 
-import gi
+logger = logging.getLogger(__name__)
 
-gi.require_version("Gtk", "4.0")
-from gi.repository import GLib, Gtk  # noqa: E402
 
-logger = logging.getLogger(__name__)
+@cache
+def _gi_repository():
+    """Load the GI stack on first use.
+
+    Importing Gtk pulls in dozens of MB of shared libraries, so defer it
+    until a UI object is actually constructed - tests and non-GUI paths
+    never pay for it.
+    """
+    import gi
+
+    gi.require_version("Gtk", "4.0")
+    from gi.repository import Gio, GLib, Gtk
+
+    return Gio, GLib, Gtk
 
 
 class DictationUI:
     """Manages UI feedback using notifications and optional GTK window"""
 
+    _URGENCY_LEVELS = {"low": 0, "normal": 1, "critical": 2}
+
     def __init__(self, config):
         self.config = config
         self.notification_icon = "audio-input-microphone"
+        # Invariant part of the notify-send fallback argv, built once
+        self._notify_prefix = ("notify-send", "-i", self.notification_icon, "-t", "3000")
+        # Last notification id: passing it back as replaces_id makes the
+        # toast update in place instead of stacking
+        self._nid = 0
+        # Fallback notify-send processes awaiting reaping (poll() collects
+        # the exit status, otherwise each fork lingers as a zombie)
+        self._fallback_procs: list[subprocess.Popen] = []
+        try:
+            self._gio, self._glib, _ = _gi_repository()
+            self._bus = self._gio.bus_get_sync(self._gio.BusType.SESSION, None)
+        except Exception as e:
+            logger.warning(f"No session bus, falling back to notify-send: {e}")
+            self._bus = None
 
     def _notify(self, title: str, message: str, urgency: str = "normal"):
-        """Show desktop notification"""
+        """Show desktop notification via D-Bus (notify-send as fallback)"""
+        if self._bus is not None:
+            try:
+                reply = self._bus.call_sync(
+                    "org.freedesktop.Notifications",
+                    "/org/freedesktop/Notifications",
+                    "org.freedesktop.Notifications",
+                    "Notify",
+                    self._glib.Variant(
+                        "(susssasa{sv}i)",
+                        (
+                            "whisper-dictation",
+                            self._nid,
+                            self.notification_icon,
+                            title,
+                            message,
+                            [],
+                            {
+                                "urgency": self._glib.Variant(
+                                    "y", self._URGENCY_LEVELS.get(urgency, 1)
+                                )
+                            },
+                            3000,
+                        ),
+                    ),
+                    self._glib.VariantType("(u)"),
+                    self._gio.DBusCallFlags.NONE,
+                    -1,
+                    None,
+                )
+                self._nid = reply.unpack()[0]
+                return
+            except Exception as e:
+                logger.error(f"D-Bus notification error: {e}")
+
         try:
-            subprocess.Popen(
-                [
-                    "notify-send",
-                    "-i",
-                    self.notification_icon,
-                    "-u",
-                    urgency,
-                    title,
-                    message,
-                    "-t",
-                    "3000",
-                ]
+            # Reap notify-sends from earlier calls before spawning another
+            self._fallback_procs = [p for p in self._fallback_procs if p.poll() is None]
+            self._fallback_procs.append(
+                subprocess.Popen((*self._notify_prefix, "-u", urgency, title, message))
             )
         except Exception as e:
             logger.error(f"Notification error: {e}")
@@ -56,44 +110,80 @@ class DictationUI:
 
     def show_success(self, text: str):
         """Show success with transcribed text preview"""
-        preview = text[:50] + ("..." if len(text) > 50 else "")
+        # Short texts pass through unchanged (no slice+concat allocations);
+        # long ones get the ellipsis within the 50-column budget
+        preview = text if len(text) <= 50 else text[:47] + "..."
         logger.info(f"UI: Success - {preview}")
         self._notify("Dictation Complete", f"✅ {preview}")
+        # End of the dictation cycle: the next recording gets a fresh toast
+        self._nid = 0
 
     def show_error(self, message: str):
         """Show error message"""
         logger.warning(f"UI: Error - {message}")
         self._notify("Dictation Error", f"❌ {message}", urgency="critical")
+        self._nid = 0
 
     def close(self):
         """Cleanup UI resources"""
         logger.info("UI: Closing")
-        # Cleanup if needed
+        self._nid = 0
 
 
 # Future: GTK4 floating window for real-time waveform/status
-class DictationWindow(Gtk.Window):
-    """Optional floating window for live transcription feedback"""
-
-    def __init__(self):
-        super().__init__(title="Whisper Dictation")
-        self.set_default_size(400, 100)
-        self.set_decorated(False)
-        self.set_keep_above(True)
-
-        # Center window
-        self.set_halign(Gtk.Align.CENTER)
-        self.set_valign(Gtk.Align.CENTER)
-
-        # Create label
-        self.label = Gtk.Label(label="Ready")
-        self.label.set_margin_start(20)
-        self.label.set_margin_end(20)
-        self.label.set_margin_top(20)
-        self.label.set_margin_bottom(20)
-
-        self.set_child(self.label)
-
-    def update_text(self, text: str):
-        """Update displayed text"""
-        GLib.idle_add(self.label.set_text, text)
+@cache
+def _dictation_window_cls():
+    """Build the window class on first use (keeps the GTK import lazy)"""
+    _, GLib, Gtk = _gi_repository()
+
+    class DictationWindow(Gtk.Window):
+        """Optional floating window for live transcription feedback"""
+
+        def __init__(self):
+            super().__init__(title="Whisper Dictation")
+            self.set_default_size(400, 100)
+            self.set_decorated(False)
+            self.set_keep_above(True)
+
+            # Center window
+            self.set_halign(Gtk.Align.CENTER)
+            self.set_valign(Gtk.Align.CENTER)
+
+            # Create label
+            self.label = Gtk.Label(label="Ready")
+            self.label.set_margin_start(20)
+            self.label.set_margin_end(20)
+            self.label.set_margin_top(20)
+            self.label.set_margin_bottom(20)
+
+            self.set_child(self.label)
+
+            # Coalescing state for update_text
+            self._pending_text = None
+            self._flush_scheduled = False
+
+        def update_text(self, text: str):
+            """Update displayed text (coalesced to ~30Hz)
+
+            Streaming transcription can produce dozens of partial hypotheses
+            per second; scheduling one main-loop hop per partial would
+            re-layout the label each time. Keep only the latest text and
+            flush at most every 33ms.
+            """
+            self._pending_text = text
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                GLib.timeout_add(33, self._flush_text)
+
+        def _flush_text(self):
+            """Apply the most recent pending text on the GTK main loop"""
+            self._flush_scheduled = False
+            self.label.set_text(self._pending_text)
+            return GLib.SOURCE_REMOVE
+
+    return DictationWindow
+
+
+def create_dictation_window():
+    """Create the optional floating feedback window"""
+    return _dictation_window_cls()()
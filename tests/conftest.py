@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+from whisper_dictation.config import Config
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Create test configuration (parsed once for the whole suite)"""
+    return Config()
@@ -17,25 +17,35 @@ def test_default_config_creation(tmp_path):
     assert config.get("hotkey.key") == "period"
 
 
-def test_config_loading(tmp_path):
-    """Test loading existing config file"""
+def test_config_loading():
+    """Test building config from an in-memory mapping"""
+    config = Config.from_mapping(
+        {
+            "hotkey": {"key": "comma", "modifiers": ["ctrl", "alt"]},
+            "whisper": {"model": "large", "language": "es"},
+        }
+    )
+
+    assert config.get("hotkey.key") == "comma"
+    assert config.get("whisper.model") == "large"
+    assert config.get("whisper.language") == "es"
+
+
+def test_partial_config_keeps_section_defaults(tmp_path):
+    """Test that overriding one key in a section keeps its other defaults"""
     config_path = tmp_path / "config.yaml"
     config_path.write_text(
         """
-hotkey:
-  key: comma
-  modifiers: [ctrl, alt]
 whisper:
-  model: large
-  language: es
+  language: it
 """
     )
 
     config = Config(config_path)
 
-    assert config.get("hotkey.key") == "comma"
-    assert config.get("whisper.model") == "large"
-    assert config.get("whisper.language") == "es"
+    assert config.get("whisper.language") == "it"
+    assert config.get("whisper.model") == "medium"
+    assert config.get("whisper.threads") == 4
 
 
 def test_hotkey_display():
@@ -52,7 +62,7 @@ def test_model_path():
     """Test model path resolution"""
     config = Config()
 
-    model_path = config.get_model_path()
+    model_path = config.model_path
 
     assert isinstance(model_path, Path)
     # Config now uses base model (changed for speed optimization)
@@ -6,16 +6,9 @@ from unittest.mock import patch
 
 import pytest
 
-from whisper_dictation.config import Config
 from whisper_dictation.paste import TextPaster
 
 
-@pytest.fixture
-def config():
-    """Create test configuration"""
-    return Config()
-
-
 @pytest.fixture
 def paster(config):
     """Create TextPaster instance"""
@@ -27,14 +20,28 @@ def test_paste_text(mock_run, paster):
     """Test pasting text via ydotool"""
     text = "Hello world"
 
-    paster.paste(text)
+    paster.paste(text, wait=True)
 
     mock_run.assert_called_once()
     call_args = mock_run.call_args[0][0]
 
     assert "ydotool" in call_args
     assert "type" in call_args
-    assert text in call_args
+    # Text travels over stdin, not argv
+    assert mock_run.call_args.kwargs["input"] == text.encode()
+
+
+@patch("subprocess.Popen")
+def test_paste_non_blocking(mock_popen, paster):
+    """Test the default paste dispatches without waiting on ydotool"""
+    text = "Hello world"
+
+    paster.paste(text)
+
+    mock_popen.assert_called_once()
+    call_args = mock_popen.call_args[0][0]
+    assert "ydotool" in call_args
+    mock_popen.return_value.stdin.write.assert_called_once_with(text.encode())
 
 
 def test_paste_empty_text(paster):
@@ -45,13 +52,44 @@ def test_paste_empty_text(paster):
         mock_run.assert_not_called()
 
 
+@patch("subprocess.run")
+def test_paste_long_text_uses_clipboard(mock_run, config):
+    """Test long text goes through the clipboard instead of per-key typing"""
+    with patch("shutil.which", return_value="/usr/bin/wl-copy"):
+        paster = TextPaster(config)
+    mock_run.reset_mock()  # Drop the ydotoold check from construction
+    text = "word " * 50
+
+    paster.paste(text, wait=True)
+
+    # One clipboard write, then a single Ctrl+V
+    copy_call, key_call = mock_run.call_args_list
+    assert copy_call.args[0][0] == "/usr/bin/wl-copy"
+    assert copy_call.kwargs["input"] == text.encode()
+    assert key_call.args[0][:2] == ("ydotool", "key")
+
+
+@patch("subprocess.run")
+def test_paste_long_text_without_clipboard_blocks(mock_run, config):
+    """Test long text without wl-copy falls back to a blocking type"""
+    with patch("shutil.which", return_value=None):
+        paster = TextPaster(config)
+    mock_run.reset_mock()  # Drop the ydotoold check from construction
+    text = "word " * 50
+
+    paster.paste(text)
+
+    # Too big for the non-blocking stdin write: must go through run()
+    mock_run.assert_called_once()
+    assert mock_run.call_args.kwargs["input"] == text.encode()
+
+
 @patch("subprocess.run")
 def test_paste_special_characters(mock_run, paster):
     """Test pasting text with special characters"""
     text = "Special: @#$%^&*()"
 
-    paster.paste(text)
+    paster.paste(text, wait=True)
 
     mock_run.assert_called_once()
-    call_args = mock_run.call_args[0][0]
-    assert text in call_args
+    assert mock_run.call_args.kwargs["input"] == text.encode()
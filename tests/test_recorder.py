@@ -2,30 +2,23 @@
 Tests for audio recording functionality
 """
 
+import signal
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from whisper_dictation.config import Config
 from whisper_dictation.recorder import AudioRecorder
 
 
-@pytest.fixture
-def config():
-    """Create test configuration"""
-    return Config()
-
-
 @pytest.fixture
 def recorder(config):
-    """Create AudioRecorder instance"""
-    return AudioRecorder(config)
+    """Create AudioRecorder instance (ffmpeg fallback path)"""
+    with patch("shutil.which", return_value=None):
+        return AudioRecorder(config)
 
 
 def test_recorder_initialization(recorder):
     """Test recorder initializes correctly"""
-    assert recorder.temp_dir.exists()
-    assert recorder.audio_file.parent == recorder.temp_dir
     assert recorder.process is None
 
 
@@ -33,6 +26,7 @@ def test_recorder_initialization(recorder):
 def test_start_recording(mock_popen, recorder):
     """Test starting audio recording"""
     mock_process = MagicMock()
+    mock_process.stdout.read.return_value = b""
     mock_popen.return_value = mock_process
 
     recorder.start()
@@ -40,34 +34,47 @@ def test_start_recording(mock_popen, recorder):
     assert recorder.process == mock_process
     mock_popen.assert_called_once()
 
-    # Verify ffmpeg command
+    # Verify ffmpeg command streams WAV to stdout
     call_args = mock_popen.call_args[0][0]
     assert "ffmpeg" in call_args
     assert "-f" in call_args
     assert "pulse" in call_args
+    assert "pipe:1" in call_args
 
 
 @patch("subprocess.Popen")
-def test_stop_recording(mock_popen, recorder, tmp_path):
-    """Test stopping audio recording"""
-    # Create fake audio file
-    audio_file = tmp_path / "recording.wav"
-    audio_file.write_bytes(b"fake audio data" * 1000)  # Make it substantial
-    recorder.audio_file = audio_file
-
-    # Mock process
+def test_stop_recording(mock_popen, recorder):
+    """Test stopping audio recording returns the captured audio"""
+    audio_data = b"fake audio data" * 1000  # Make it substantial
     mock_process = MagicMock()
-    mock_process.wait = MagicMock()
-    recorder.process = mock_process
+    mock_process.stdout.read.side_effect = [audio_data, b""]
+    mock_popen.return_value = mock_process
 
+    recorder.start()
     result = recorder.stop()
 
-    mock_process.terminate.assert_called_once()
+    mock_process.send_signal.assert_called_once_with(signal.SIGINT)
     mock_process.wait.assert_called()
-    assert result == audio_file
+    assert result == audio_data
     assert recorder.process is None
 
 
+@patch("subprocess.Popen")
+def test_prefers_parecord_when_available(mock_popen, config):
+    """Test parecord is used instead of ffmpeg when installed"""
+    mock_process = MagicMock()
+    mock_process.stdout.read.return_value = b""
+    mock_popen.return_value = mock_process
+
+    with patch("shutil.which", return_value="/usr/bin/parecord"):
+        recorder = AudioRecorder(config)
+    recorder.start()
+
+    call_args = mock_popen.call_args[0][0]
+    assert call_args[0] == "parecord"
+    assert "--rate=16000" in call_args
+
+
 def test_stop_without_start(recorder):
     """Test stopping recording that was never started"""
     result = recorder.stop()
@@ -76,16 +83,14 @@ def test_stop_without_start(recorder):
 
 
 @patch("subprocess.Popen")
-def test_stop_with_empty_file(mock_popen, recorder, tmp_path):
-    """Test stopping recording that produced empty file"""
-    audio_file = tmp_path / "recording.wav"
-    audio_file.write_bytes(b"")  # Empty file
-    recorder.audio_file = audio_file
-
+def test_stop_with_no_audio(mock_popen, recorder):
+    """Test stopping recording that captured no audio"""
     mock_process = MagicMock()
-    recorder.process = mock_process
+    mock_process.stdout.read.return_value = b""
+    mock_popen.return_value = mock_process
 
+    recorder.start()
     result = recorder.stop()
 
-    # Should return None for empty file
+    # Should return None when nothing was captured
     assert result is None